@@ -0,0 +1,48 @@
+"""Generate daily consumption and weeks remaining
+
+Revision ID: d3a8f61c2e47
+Revises: b7e2d41c9a05
+Create Date: 2026-10-15 14:22:09.731456
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a8f61c2e47'
+down_revision: Union[str, None] = 'b7e2d41c9a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Copied from app.models so this migration keeps working if the model changes
+DAILY_CONSUMPTION_SQL = (
+    "CASE WHEN schedule_type = 'weekly_alternating' "
+    "THEN COALESCE((even_week_pills + odd_week_pills) / 14.0, 0) "
+    "ELSE morning_pre_food + morning_post_food + evening_pre_food + evening_post_food END"
+)
+WEEKS_REMAINING_SQL = (
+    "CASE WHEN daily_consumption = 0 THEN 0 "
+    "ELSE current_amount / daily_consumption / 7 END"
+)
+
+
+def upgrade() -> None:
+    # SQLite can only add VIRTUAL generated columns to an existing table,
+    # so the stored column is dropped and re-added as a generated one.
+    op.drop_index('ix_drugs_reorder', table_name='drugs')
+    op.drop_column('drugs', 'daily_consumption')
+    op.add_column('drugs', sa.Column('daily_consumption', sa.Float(), sa.Computed(DAILY_CONSUMPTION_SQL, persisted=False), nullable=True))
+    op.add_column('drugs', sa.Column('weeks_remaining', sa.Float(), sa.Computed(WEEKS_REMAINING_SQL, persisted=False), nullable=True))
+    op.create_index('ix_drugs_reorder', 'drugs', ['weeks_remaining'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_drugs_reorder', table_name='drugs')
+    op.drop_column('drugs', 'weeks_remaining')
+    op.drop_column('drugs', 'daily_consumption')
+    op.add_column('drugs', sa.Column('daily_consumption', sa.Float(), server_default='0', nullable=False))
+    op.execute(f"UPDATE drugs SET daily_consumption = {DAILY_CONSUMPTION_SQL}")
+    op.create_index('ix_drugs_reorder', 'drugs', ['daily_consumption', 'current_amount'], unique=False)
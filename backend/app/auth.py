@@ -5,23 +5,41 @@ Provides simple authentication with a single user (no signup).
 Uses JWT tokens for session management.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
+import hashlib
 import os
+import threading
+import time
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
 from pydantic import BaseModel
+import bcrypt
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing cost. Hashing and verifying take 2^rounds iterations,
+# so each extra round doubles login latency. Existing hashes keep their own
+# cost (it is stored in the hash prefix), so changing this is safe.
+BCRYPT_ROUNDS = int(os.getenv("AUTH_BCRYPT_ROUNDS", "10"))
+
+# Recently verified logins, so repeat logins skip the slow bcrypt check.
+# Maps sha256(username:password:hash) -> True. Including the hash means a
+# changed AUTH_PASSWORD_HASH never matches old entries; failures are not cached.
+_login_cache = TTLCache(maxsize=1024, ttl=60)
+_login_cache_lock = threading.Lock()
 
 # JWT settings
 SECRET_KEY = os.getenv("AUTH_SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 1 week
 
+# Decoded tokens, so each token's signature is only checked once a minute.
+# Maps sha256(token) -> (username, exp timestamp); hashing keeps the raw
+# bearer tokens out of memory and gives small fixed-size keys.
+_token_cache = TTLCache(maxsize=10000, ttl=60)
+_token_cache_lock = threading.Lock()
+
 # Security scheme
 security = HTTPBearer()
 
@@ -49,7 +67,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Malformed hash in the environment
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -62,7 +84,47 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: Hashed password.
     """
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+def calibrate_password_hash() -> float:
+    """
+    Measure how long hashing a password takes with the configured cost.
+
+    Returns:
+        float: Duration of one hash in milliseconds.
+    """
+    start = time.perf_counter()
+    get_password_hash("calibration")
+    return (time.perf_counter() - start) * 1000
+
+
+def _verify_cached(username: str, password: str, hashed_password: str) -> bool:
+    """
+    Verify a password, remembering successful checks for a minute.
+
+    Only successful verifications are cached, so wrong passwords always
+    go through bcrypt and brute forcing stays as slow as before.
+
+    Args:
+        username (str): The username being logged in.
+        password (str): The plain text password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if password matches, False otherwise.
+    """
+    key = hashlib.sha256(f"{username}:{password}:{hashed_password}".encode()).digest()
+    with _login_cache_lock:
+        if key in _login_cache:
+            return True
+
+    if not verify_password(password, hashed_password):
+        return False
+
+    with _login_cache_lock:
+        _login_cache[key] = True
+    return True
 
 
 def authenticate_user(username: str, password: str) -> bool:
@@ -90,7 +152,7 @@ def authenticate_user(username: str, password: str) -> bool:
         # If no hash is set, reject login for security
         return False
 
-    return verify_password(password, valid_password_hash)
+    return _verify_cached(username, password, valid_password_hash)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -105,10 +167,11 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         str: Encoded JWT token.
     """
     to_encode = data.copy()
+    # JWT stores exp as a UNIX timestamp, so compute it as an int directly
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -134,13 +197,26 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    token = credentials.credentials
+    token_key = hashlib.sha256(token.encode()).digest()
+    with _token_cache_lock:
+        cached = _token_cache.get(token_key)
+    if cached is not None:
+        username, exp = cached
+        if exp > time.time():
+            return username
+
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
 
+    exp = payload.get("exp")
+    if exp is not None:
+        with _token_cache_lock:
+            _token_cache[token_key] = (username, exp)
+
     return username
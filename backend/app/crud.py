@@ -5,9 +5,10 @@ This module contains all the database operations for managing drugs.
 It separates database logic from the API routes for better organization.
 """
 
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 from . import models, schemas
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime, date
 
 
@@ -25,7 +26,6 @@ def create_drug(db: Session, drug: schemas.DrugCreate) -> models.Drug:
     db_drug = models.Drug(**drug.model_dump())
     db.add(db_drug)
     db.commit()
-    db.refresh(db_drug)
     return db_drug
 
 
@@ -40,7 +40,24 @@ def get_drug(db: Session, drug_id: int) -> Optional[models.Drug]:
     Returns:
         Drug or None: The drug if found, None otherwise.
     """
-    return db.query(models.Drug).filter(models.Drug.id == drug_id).first()
+    return db.get(models.Drug, drug_id)
+
+
+def get_drug_updated_at(db: Session, drug_id: int) -> Optional[datetime]:
+    """
+    Get only the last modification time of a drug.
+
+    Args:
+        db (Session): Database session.
+        drug_id (int): The drug's ID.
+
+    Returns:
+        datetime or None: When the drug was last modified, None if not found.
+
+    Much cheaper than loading the full drug, used to answer ETag checks.
+    """
+    stmt = select(models.Drug.updated_at).where(models.Drug.id == drug_id)
+    return db.execute(stmt).scalar()
 
 
 def get_drugs(db: Session, skip: int = 0, limit: int = 100) -> List[models.Drug]:
@@ -55,7 +72,37 @@ def get_drugs(db: Session, skip: int = 0, limit: int = 100) -> List[models.Drug]
     Returns:
         List[Drug]: List of drug objects.
     """
-    return db.query(models.Drug).offset(skip).limit(limit).all()
+    stmt = select(models.Drug).order_by(models.Drug.id).offset(skip).limit(limit)
+    return db.execute(stmt).scalars().all()
+
+
+def get_drug_batches(
+    db: Session, last_id: int = 0, skip: Optional[int] = None, limit: int = 100, batch_size: int = 50
+) -> Iterator[List[models.Drug]]:
+    """
+    Stream a page of drugs from the database in batches.
+
+    Args:
+        db (Session): Database session, must stay open while iterating.
+        last_id (int): ID of the last drug on the previous page (keyset pagination).
+        skip (int, optional): Offset to use instead of last_id (legacy pagination).
+        limit (int): Maximum number of records to return.
+        batch_size (int): Number of drugs loaded per batch.
+
+    Returns:
+        Iterator[List[Drug]]: Lists of up to batch_size drugs, ordered by ID.
+
+    Unlike OFFSET, last_id seeks straight into the primary key index, so later
+    pages are as cheap as the first. Uses yield_per, so only one batch of rows
+    is held in memory at a time.
+    """
+    stmt = select(models.Drug).order_by(models.Drug.id).limit(limit)
+    if skip is not None:
+        stmt = stmt.offset(skip)
+    else:
+        stmt = stmt.where(models.Drug.id > last_id)
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    return result.scalars().partitions()
 
 
 def update_drug(
@@ -84,7 +131,6 @@ def update_drug(
         setattr(db_drug, field, value)
 
     db.commit()
-    db.refresh(db_drug)
     return db_drug
 
 
@@ -133,7 +179,6 @@ def refill_drug(db: Session, drug_id: int, packages: int) -> Optional[models.Dru
     db_drug.last_refilled_at = datetime.utcnow()
 
     db.commit()
-    db.refresh(db_drug)
     return db_drug
 
 
@@ -147,10 +192,16 @@ def get_drugs_needing_reorder(db: Session) -> List[models.Drug]:
     Returns:
         List[Drug]: Drugs that need reordering.
 
-    This queries all drugs and filters those with less than 3 weeks remaining.
+    Drug.needs_reorder is a hybrid property over the generated (and indexed)
+    weeks_remaining column, so the filter runs in SQL and only the drugs that
+    need reordering are loaded.
     """
-    all_drugs = get_drugs(db)
-    return [drug for drug in all_drugs if drug.needs_reorder]
+    stmt = (
+        select(models.Drug)
+        .where(models.Drug.needs_reorder)
+        .order_by(models.Drug.id)
+    )
+    return db.execute(stmt).scalars().all()
 
 
 # Doctor Vacation CRUD operations
@@ -169,7 +220,6 @@ def create_doctor_vacation(db: Session, vacation: schemas.DoctorVacationCreate)
     db_vacation = models.DoctorVacation(**vacation.model_dump())
     db.add(db_vacation)
     db.commit()
-    db.refresh(db_vacation)
     return db_vacation
 
 
@@ -184,7 +234,7 @@ def get_doctor_vacation(db: Session, vacation_id: int) -> Optional[models.Doctor
     Returns:
         DoctorVacation or None: The vacation if found, None otherwise.
     """
-    return db.query(models.DoctorVacation).filter(models.DoctorVacation.id == vacation_id).first()
+    return db.get(models.DoctorVacation, vacation_id)
 
 
 def get_doctor_vacations(db: Session, skip: int = 0, limit: int = 100) -> List[models.DoctorVacation]:
@@ -199,7 +249,39 @@ def get_doctor_vacations(db: Session, skip: int = 0, limit: int = 100) -> List[m
     Returns:
         List[DoctorVacation]: List of vacation periods, ordered by start_date.
     """
-    return db.query(models.DoctorVacation).order_by(models.DoctorVacation.start_date).offset(skip).limit(limit).all()
+    stmt = (
+        select(models.DoctorVacation)
+        .order_by(models.DoctorVacation.start_date, models.DoctorVacation.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return db.execute(stmt).scalars().all()
+
+
+def get_doctor_vacations_after(
+    db: Session, last_start_date: Optional[date] = None, last_id: int = 0, limit: int = 100
+) -> List[models.DoctorVacation]:
+    """
+    Get the next page of doctor vacation periods (keyset pagination).
+
+    Args:
+        db (Session): Database session.
+        last_start_date (date, optional): start_date of the last vacation on the previous page.
+            None for the first page.
+        last_id (int): ID of the last vacation on the previous page.
+        limit (int): Maximum number of records to return.
+
+    Returns:
+        List[DoctorVacation]: Vacation periods after the given one, ordered by start_date.
+    """
+    vacation = models.DoctorVacation
+    stmt = select(vacation).order_by(vacation.start_date, vacation.id).limit(limit)
+    if last_start_date is not None:
+        stmt = stmt.where(or_(
+            vacation.start_date > last_start_date,
+            and_(vacation.start_date == last_start_date, vacation.id > last_id),
+        ))
+    return db.execute(stmt).scalars().all()
 
 
 def update_doctor_vacation(db: Session, vacation_id: int, vacation_update: schemas.DoctorVacationUpdate) -> Optional[models.DoctorVacation]:
@@ -223,7 +305,6 @@ def update_doctor_vacation(db: Session, vacation_id: int, vacation_update: schem
         setattr(db_vacation, field, value)
 
     db.commit()
-    db.refresh(db_vacation)
     return db_vacation
 
 
@@ -258,7 +339,8 @@ def get_current_doctor_vacation(db: Session) -> Optional[models.DoctorVacation]:
         DoctorVacation or None: Current vacation if doctor is on vacation, None otherwise.
     """
     today = date.today()
-    return db.query(models.DoctorVacation).filter(
+    stmt = select(models.DoctorVacation).where(
         models.DoctorVacation.start_date <= today,
         models.DoctorVacation.end_date >= today
-    ).first()
+    ).limit(1)
+    return db.execute(stmt).scalars().first()
@@ -7,7 +7,7 @@ It provides the database engine, session maker, and base class for models.
 
 import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -26,12 +26,40 @@ SQLALCHEMY_DATABASE_URL = f"sqlite:///./{db_path}"
 
 # Create the SQLite engine
 # connect_args={"check_same_thread": False} is needed for SQLite to work with FastAPI
+# A small connection pool lets request handlers and scheduled jobs each use
+# their own connection instead of waiting for one another
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=5,
+    max_overflow=10,
 )
 
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Configure every new SQLite connection.
+
+    WAL mode lets readers and the writer work at the same time, and
+    synchronous=NORMAL only syncs to disk at checkpoints instead of on
+    every commit (safe in WAL mode). The remaining pragmas keep temporary
+    tables in memory, enlarge the page cache to ~20 MB, memory-map up to
+    128 MB of the file and enforce foreign keys.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA mmap_size=134217728")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 # SessionLocal class will be used to create database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps objects loaded after commit, so CRUD functions
+# can return them without another SELECT (all column defaults are set in Python)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # Base class for our database models
 Base = declarative_base()
@@ -9,12 +9,16 @@ This module handles sending email notifications for:
 Uses Mailjet API for reliable transactional email delivery.
 """
 
-from mailjet_rest import Client
+import httpx
 from typing import List, Optional
 from . import models
 import os
 from datetime import datetime
 
+# Mailjet Send API v3.1 endpoint
+MAILJET_API_URL = "https://api.mailjet.com"
+MAILJET_SEND_URL = f"{MAILJET_API_URL}/v3.1/send"
+
 
 class EmailService:
     """
@@ -38,11 +42,63 @@ class EmailService:
         self.to_email = os.getenv("TO_EMAIL", "")
         self.to_name = os.getenv("TO_NAME", "")
 
-        # Initialize Mailjet client
-        if self.api_key and self.api_secret:
-            self.mailjet = Client(auth=(self.api_key, self.api_secret), version='v3.1')
-        else:
-            self.mailjet = None
+        # One Mailjet HTTP client for the whole process, so every email after
+        # the first reuses the open connection instead of a new TLS handshake
+        self.mailjet = self._create_client() if self.api_key and self.api_secret else None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """
+        Create the Mailjet HTTP client.
+
+        Emails go out one at a time, so two pooled connections are plenty;
+        failed connection attempts are retried twice.
+
+        Returns:
+            httpx.AsyncClient: Client authenticated with the Mailjet API keys.
+        """
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=2, max_keepalive_connections=2),
+            retries=2,
+        )
+        return httpx.AsyncClient(
+            auth=(self.api_key, self.api_secret), timeout=10.0, transport=transport
+        )
+
+    def _client(self) -> httpx.AsyncClient:
+        """
+        Get the shared Mailjet client, reopening it if it was closed.
+
+        Returns:
+            httpx.AsyncClient: An open Mailjet client.
+        """
+        if self.mailjet.is_closed:
+            self.mailjet = self._create_client()
+        return self.mailjet
+
+    @property
+    def is_configured(self) -> bool:
+        """bool: True if Mailjet credentials and both email addresses are set."""
+        return bool(self.mailjet and self.from_email and self.to_email)
+
+    async def warmup(self):
+        """
+        Open the connection to Mailjet ahead of the first email.
+
+        Does the TLS handshake at startup so the first reminder doesn't pay
+        for it. Failures are only logged; sending will connect again anyway.
+        """
+        if not self.mailjet:
+            return
+
+        try:
+            await self._client().head(MAILJET_API_URL)
+        except httpx.HTTPError as e:
+            print(f"Could not pre-connect to Mailjet: {e}")
+
+    async def close(self):
+        """Close the Mailjet HTTP client and its open connections."""
+        if self.mailjet:
+            await self.mailjet.aclose()
 
     async def send_email(self, subject: str, body: str) -> bool:
         """
@@ -55,7 +111,7 @@ class EmailService:
         Returns:
             bool: True if sent successfully, False otherwise.
         """
-        if not self.mailjet or not self.from_email or not self.to_email:
+        if not self.is_configured:
             print("Mailjet not configured. Skipping email send.")
             print("Required: MAILJET_API_KEY, MAILJET_API_SECRET, FROM_EMAIL, TO_EMAIL")
             return False
@@ -80,7 +136,7 @@ class EmailService:
                 ]
             }
 
-            result = self.mailjet.send.create(data=data)
+            result = await self._client().post(MAILJET_SEND_URL, json=data)
 
             if result.status_code == 200:
                 print(f"Email sent successfully: {subject}")
@@ -106,28 +162,31 @@ class EmailService:
         """
         subject = "Weekly Medicine Reminder - Time to Set Up Pills"
 
-        body = "Hello! It's time to set up grandma's medicines for the week.\n\n"
-        body += "Current Medicine Plan:\n"
-        body += "-" * 50 + "\n\n"
+        parts = [
+            "Hello! It's time to set up grandma's medicines for the week.\n\n",
+            "Current Medicine Plan:\n",
+            "-" * 50 + "\n\n",
+        ]
 
         for drug in drugs:
-            body += f"• {drug.name}"
+            parts.append(f"• {drug.name}")
             if drug.dosage_strength:
-                body += f" ({drug.dosage_strength})"
-            body += "\n"
+                parts.append(f" ({drug.dosage_strength})")
+            parts.append("\n")
 
             # Show schedule based on type
             if drug.schedule_type == 'weekly_alternating':
-                body += f"  Schedule: Weekly alternating ({drug.current_week_type} week)\n"
-                body += f"  This week: {drug.current_week_pills} pills\n"
+                parts.append(f"  Schedule: Weekly alternating ({drug.current_week_type} week)\n")
+                parts.append(f"  This week: {drug.current_week_pills} pills\n")
             else:
                 total_daily = drug.morning_pre_food + drug.morning_post_food + drug.evening_pre_food + drug.evening_post_food
-                body += f"  Daily: {total_daily} pill(s)\n"
+                parts.append(f"  Daily: {total_daily} pill(s)\n")
 
-            body += f"  Pills remaining: {drug.current_amount}\n"
-            body += f"  Days remaining: {drug.days_remaining:.1f} days\n\n"
+            parts.append(f"  Pills remaining: {drug.current_amount}\n")
+            parts.append(f"  Days remaining: {drug.days_remaining:.1f} days\n\n")
 
-        body += "\nHave a great week!\n"
+        parts.append("\nHave a great week!\n")
+        body = "".join(parts)
 
         return await self.send_email(subject, body)
 
@@ -148,18 +207,20 @@ class EmailService:
 
         subject = "Medikamentenbestellung - Dora Langenhop"
 
-        body = "Guten Tag,\n\n"
-        body += "es werden Rezepte benötigt für die folgenden Medikamente für Dora Langenhop, geb. 23.04.1937.\n\n"
+        parts = [
+            "Guten Tag,\n\n",
+            "es werden Rezepte benötigt für die folgenden Medikamente für Dora Langenhop, geb. 23.04.1937.\n\n",
+        ]
 
         for drug in drugs:
-            body += f"- {drug.name}"
+            parts.append(f"- {drug.name}")
             if drug.dosage_strength:
-                body += f" {drug.dosage_strength}"
-            body += f", Packungsgröße: {drug.package_size} Tabletten\n"
-
+                parts.append(f" {drug.dosage_strength}")
+            parts.append(f", Packungsgröße: {drug.package_size} Tabletten\n")
 
-        body += "\nViele Grüße\n"
-        body += "Jan Uhrhammer"
+        parts.append("\nViele Grüße\n")
+        parts.append("Jan Uhrhammer")
+        body = "".join(parts)
 
         return await self.send_email(subject, body)
 
@@ -174,25 +235,15 @@ class EmailService:
             bool: True if no drug was refilled in the current quarter.
         """
         now = datetime.now()
-        current_year = now.year
         current_quarter = (now.month - 1) // 3 + 1  # 1, 2, 3, or 4
 
-        # Calculate the start month of the current quarter
-        quarter_start_month = (current_quarter - 1) * 3 + 1
-
-        # Check if any drug was refilled in the current quarter
-        for drug in all_drugs:
-            if drug.last_refilled_at:
-                refill_year = drug.last_refilled_at.year
-                refill_month = drug.last_refilled_at.month
-                refill_quarter = (refill_month - 1) // 3 + 1
-
-                # If refilled in current quarter and year, it's not the first order
-                if refill_year == current_year and refill_quarter == current_quarter:
-                    return False
+        # Start of the current quarter; any refill since then means this is not the first order
+        quarter_start = datetime(now.year, (current_quarter - 1) * 3 + 1, 1)
 
-        # No drug was refilled this quarter, so this is the first order
-        return True
+        return not any(
+            drug.last_refilled_at and drug.last_refilled_at >= quarter_start
+            for drug in all_drugs
+        )
 
     async def send_test_email(self) -> bool:
         """
@@ -5,11 +5,16 @@ This is the entry point of the backend API. It defines all the HTTP endpoints
 for managing drugs and sets up scheduled email reminders.
 """
 
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, FastAPI, Depends, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import timedelta
+from typing import Iterator, List, Optional
+from datetime import date, datetime, timedelta
+import base64
+import binascii
+import orjson
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
@@ -23,12 +28,14 @@ if env_path.exists():
     load_dotenv(env_path)
 
 from . import models, schemas, crud
-from .database import engine, get_db
+from .database import engine, get_db, SessionLocal
 from .email_service import email_service
 from .auth import (
     authenticate_user,
     create_access_token,
     get_current_user,
+    calibrate_password_hash,
+    BCRYPT_ROUNDS,
     Token,
     LoginRequest,
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -43,6 +50,7 @@ app = FastAPI(
     title="Medicine Tracker API",
     description="API for tracking grandma's medicine and sending reminders",
     version="1.0.0",
+    default_response_class=ORJSONResponse,  # orjson encodes much faster than the stdlib json
 )
 
 # CORS middleware to allow frontend to communicate with backend
@@ -55,8 +63,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# All drug, email and vacation routes require a logged-in user. The check is
+# declared once here instead of on every route; /login and / stay public.
+authenticated_router = APIRouter(dependencies=[Depends(get_current_user)])
+
 # Scheduler for automated reminders
-scheduler = AsyncIOScheduler()
+# Missed runs (e.g. while the server was down) are merged into a single run,
+# and a job never runs twice at the same time
+scheduler = AsyncIOScheduler(
+    executors={"default": AsyncIOExecutor()},
+    job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 300},
+)
 
 
 @app.on_event("startup")
@@ -85,34 +102,147 @@ async def startup_event():
     scheduler.start()
     print("Scheduler started. Reminders will be sent automatically.")
 
+    # Open the Mailjet connection now so the first reminder is fast
+    await email_service.warmup()
+
+    # Log the bcrypt cost so AUTH_BCRYPT_ROUNDS can be tuned for this machine
+    print(f"Password hashing takes {calibrate_password_hash():.0f} ms (bcrypt rounds: {BCRYPT_ROUNDS})")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run when the application shuts down."""
     scheduler.shutdown()
+    await email_service.close()
 
 
 async def send_weekly_reminder_job():
     """Background job to send weekly medicine setup reminder."""
-    db = next(get_db())
-    try:
+    with SessionLocal() as db:
         drugs = crud.get_drugs(db)
-        await email_service.send_weekly_reminder(drugs)
-    finally:
-        db.close()
+    await email_service.send_weekly_reminder(drugs)
 
 
 async def send_reorder_reminder_job():
     """Background job to check and send reorder reminders."""
-    db = next(get_db())
-    try:
+    with SessionLocal() as db:
+        # One query; the reorder subset is filtered from the drugs already loaded
         all_drugs = crud.get_drugs(db)
-        drugs_to_reorder = crud.get_drugs_needing_reorder(db)
+        drugs_to_reorder = [drug for drug in all_drugs if drug.needs_reorder]
         doctor_vacation = crud.get_current_doctor_vacation(db)
-        if drugs_to_reorder:
-            await email_service.send_reorder_reminder(drugs_to_reorder, all_drugs, doctor_vacation)
-    finally:
-        db.close()
+    if drugs_to_reorder:
+        await email_service.send_reorder_reminder(drugs_to_reorder, all_drugs, doctor_vacation)
+
+
+def _encode_cursor(*values) -> str:
+    """
+    Encode the sort key of the last item on a page as an opaque cursor.
+
+    Args:
+        *values: Sort key values (e.g. the item's ID).
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    raw = ":".join(str(value) for value in values)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> List[str]:
+    """
+    Decode a cursor created by _encode_cursor.
+
+    Args:
+        cursor (str): Cursor from a previous page.
+
+    Returns:
+        List[str]: The encoded sort key values.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+    except (binascii.Error, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _current_week_type() -> str:
+    """Get "even" or "odd" for today's ISO week (computed once per request)."""
+    return models.week_type_for(date.today())
+
+
+def _drug_to_dict(drug: models.Drug, week_type: str) -> dict:
+    """
+    Flatten a drug and its computed fields into a dict shaped like DrugResponse.
+
+    Args:
+        drug (Drug): The drug loaded from the database.
+        week_type (str): Current week type ("even" or "odd").
+
+    Returns:
+        dict: All DrugResponse fields.
+
+    Each computed value is derived once here instead of Pydantic calling the
+    chain of model properties (days_remaining, weeks_remaining, ...) per field.
+    """
+    weeks_remaining = drug.weeks_remaining
+    return {
+        "id": drug.id,
+        "name": drug.name,
+        "dosage_strength": drug.dosage_strength,
+        "package_size": drug.package_size,
+        "schedule_type": drug.schedule_type,
+        "morning_pre_food": drug.morning_pre_food,
+        "morning_post_food": drug.morning_post_food,
+        "evening_pre_food": drug.evening_pre_food,
+        "evening_post_food": drug.evening_post_food,
+        "even_week_pills": drug.even_week_pills,
+        "odd_week_pills": drug.odd_week_pills,
+        "current_amount": drug.current_amount,
+        "notes": drug.notes,
+        "daily_consumption": drug.daily_consumption,
+        "days_remaining": drug.days_remaining,
+        "weeks_remaining": weeks_remaining,
+        "needs_reorder": weeks_remaining < models.REORDER_THRESHOLD_WEEKS,
+        "current_week_type": week_type,
+        "current_week_pills": drug.pills_for_week(week_type),
+        "last_refilled_at": drug.last_refilled_at,
+        "created_at": drug.created_at,
+        "updated_at": drug.updated_at,
+    }
+
+
+def _drug_etag(drug_id: int, updated_at: datetime, week_type: str) -> str:
+    """
+    Build the ETag for a single drug response.
+
+    Args:
+        drug_id (int): The drug's ID.
+        updated_at (datetime): When the drug was last modified.
+        week_type (str): Current week type ("even" or "odd").
+
+    Returns:
+        str: Weak ETag, e.g. W/"3-1760515200000000-even".
+
+    The week type is part of the tag because current_week_pills in the
+    response changes every week even if the drug itself does not.
+    """
+    return f'W/"{drug_id}-{int(updated_at.timestamp() * 1_000_000)}-{week_type}"'
+
+
+def _drug_to_response(drug: models.Drug, week_type: str) -> schemas.DrugResponse:
+    """
+    Build a DrugResponse from a drug without running Pydantic validation.
+
+    Args:
+        drug (Drug): The drug loaded from the database.
+        week_type (str): Current week type ("even" or "odd").
+
+    Returns:
+        DrugResponse: The response model (data comes from the database, so it is trusted).
+    """
+    return schemas.DrugResponse.model_construct(**_drug_to_dict(drug, week_type))
 
 
 # ============================================================================
@@ -132,7 +262,7 @@ async def root():
 
 
 @app.post("/login", response_model=Token)
-async def login(login_data: LoginRequest):
+def login(login_data: LoginRequest):
     """
     Login endpoint for authentication.
 
@@ -159,11 +289,10 @@ async def login(login_data: LoginRequest):
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-@app.post("/drugs/", response_model=schemas.DrugResponse, status_code=201)
-async def create_drug(
+@authenticated_router.post("/drugs/", response_model=schemas.DrugResponse, status_code=201)
+def create_drug(
     drug: schemas.DrugCreate,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Create a new drug in the system.
@@ -175,61 +304,118 @@ async def create_drug(
     Returns:
         DrugResponse: The created drug with all fields.
     """
-    return crud.create_drug(db, drug)
+    return _drug_to_response(crud.create_drug(db, drug), _current_week_type())
 
 
-@app.get("/drugs/", response_model=List[schemas.DrugResponse])
-async def get_drugs(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
+def _stream_drug_page(last_id: int, skip: Optional[int], page_size: int, week_type: str) -> Iterator[bytes]:
+    """
+    Stream one page of drugs as JSON, one batch of drugs per chunk.
+
+    Args:
+        last_id (int): ID of the last drug on the previous page.
+        skip (int, optional): Legacy offset to use instead of last_id.
+        page_size (int): Max number of drugs on the page.
+        week_type (str): Current week type ("even" or "odd").
+
+    Yields:
+        bytes: Pieces of a CursorPage[DrugResponse] JSON object.
+
+    Opens its own session, since the request's get_db session is already
+    closed by the time the response body is sent.
+    """
+    with SessionLocal() as db:
+        yield b'{"items":['
+        count = 0
+        last_drug_id = None
+        for batch in crud.get_drug_batches(db, last_id=last_id, skip=skip, limit=page_size):
+            chunk = b",".join(orjson.dumps(_drug_to_dict(drug, week_type)) for drug in batch)
+            yield (b"," if count else b"") + chunk
+            count += len(batch)
+            last_drug_id = batch[-1].id
+
+    next_cursor = _encode_cursor(last_drug_id) if count == page_size else None
+    yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+
+@authenticated_router.get("/drugs/", response_model=schemas.CursorPage[schemas.DrugResponse])
+def get_drugs(
+    cursor: Optional[str] = None,
+    per_page: int = Query(100, ge=1, le=100),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True),
+    limit: Optional[int] = Query(None, ge=1, deprecated=True),
 ):
     """
-    Get all drugs.
+    Get all drugs, one page at a time.
 
     Args:
-        skip (int): Number of records to skip (pagination).
-        limit (int): Max number of records to return.
-        db (Session): Database session (injected).
+        cursor (str, optional): next_cursor from the previous page.
+        per_page (int): Max number of drugs per page.
+        skip (int, optional): Deprecated offset pagination, use cursor instead.
+        limit (int, optional): Deprecated alias for per_page.
 
     Returns:
-        List[DrugResponse]: List of all drugs.
+        CursorPage[DrugResponse]: Drugs ordered by ID plus the cursor for the next page.
+
+    This is the most requested route, so it skips Pydantic entirely and streams
+    orjson-encoded dicts as the rows are read (response_model is kept for the
+    API docs). The cursor is checked first so a bad one still gets a 400.
     """
-    return crud.get_drugs(db, skip=skip, limit=limit)
+    try:
+        last_id = int(_decode_cursor(cursor)[0]) if cursor and skip is None else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    page = _stream_drug_page(last_id, skip, limit or per_page, _current_week_type())
+    return StreamingResponse(page, media_type="application/json")
 
 
-@app.get("/drugs/{drug_id}", response_model=schemas.DrugResponse)
-async def get_drug(
+@authenticated_router.get("/drugs/{drug_id}", response_model=schemas.DrugResponse)
+def get_drug(
     drug_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Get a specific drug by ID.
 
     Args:
         drug_id (int): The drug's ID.
+        request (Request): Incoming request, checked for If-None-Match.
+        response (Response): Outgoing response, gets the ETag header.
         db (Session): Database session (injected).
 
     Returns:
-        DrugResponse: The drug information.
+        DrugResponse: The drug information, or an empty 304 response if the
+            client's If-None-Match matches the current ETag.
 
     Raises:
         HTTPException: 404 if drug not found.
+
+    Only updated_at is read to check the ETag, so a client that already has
+    the current version costs no full row load and no serialization.
     """
+    week_type = _current_week_type()
+    updated_at = crud.get_drug_updated_at(db, drug_id)
+    etag = _drug_etag(drug_id, updated_at, week_type) if updated_at else None
+    if etag:
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers={"ETag": etag})
+
     drug = crud.get_drug(db, drug_id)
     if not drug:
         raise HTTPException(status_code=404, detail="Drug not found")
-    return drug
+    if etag:
+        response.headers["ETag"] = etag
+    return _drug_to_response(drug, week_type)
 
 
-@app.put("/drugs/{drug_id}", response_model=schemas.DrugResponse)
-async def update_drug(
+@authenticated_router.put("/drugs/{drug_id}", response_model=schemas.DrugResponse)
+def update_drug(
     drug_id: int,
     drug_update: schemas.DrugUpdate,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Update a drug's information.
@@ -248,14 +434,13 @@ async def update_drug(
     drug = crud.update_drug(db, drug_id, drug_update)
     if not drug:
         raise HTTPException(status_code=404, detail="Drug not found")
-    return drug
+    return _drug_to_response(drug, _current_week_type())
 
 
-@app.delete("/drugs/{drug_id}", status_code=204)
-async def delete_drug(
+@authenticated_router.delete("/drugs/{drug_id}", status_code=204)
+def delete_drug(
     drug_id: int,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Delete a drug from the system.
@@ -276,12 +461,11 @@ async def delete_drug(
     return None
 
 
-@app.post("/drugs/{drug_id}/refill", response_model=schemas.DrugResponse)
-async def refill_drug(
+@authenticated_router.post("/drugs/{drug_id}/refill", response_model=schemas.DrugResponse)
+def refill_drug(
     drug_id: int,
     refill: schemas.DrugRefill,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Refill a drug (add packages).
@@ -300,13 +484,12 @@ async def refill_drug(
     drug = crud.refill_drug(db, drug_id, refill.packages)
     if not drug:
         raise HTTPException(status_code=404, detail="Drug not found")
-    return drug
+    return _drug_to_response(drug, _current_week_type())
 
 
-@app.get("/drugs-status/reorder", response_model=List[schemas.DrugResponse])
-async def get_drugs_needing_reorder(
+@authenticated_router.get("/drugs-status/reorder", response_model=List[schemas.DrugResponse])
+def get_drugs_needing_reorder(
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Get drugs that need reordering (< 3 weeks remaining).
@@ -317,75 +500,92 @@ async def get_drugs_needing_reorder(
     Returns:
         List[DrugResponse]: Drugs needing reorder.
     """
-    return crud.get_drugs_needing_reorder(db)
+    week_type = _current_week_type()
+    return [_drug_to_response(drug, week_type) for drug in crud.get_drugs_needing_reorder(db)]
+
 
+# Returned by the email routes when Mailjet settings are missing
+EMAIL_NOT_CONFIGURED = {"message": "Email is not configured. Check the Mailjet settings."}
 
-@app.post("/test-email")
-async def send_test_email(current_user: str = Depends(get_current_user)):
+
+@authenticated_router.post("/test-email")
+def send_test_email(
+    background_tasks: BackgroundTasks,
+):
     """
     Send a test email to verify email configuration.
 
+    The email is sent in the background after the response is returned.
+
+    Args:
+        background_tasks (BackgroundTasks): Tasks to run after the response (injected).
+
     Returns:
-        dict: Success or error message.
+        dict: Status message.
     """
-    success = await email_service.send_test_email()
-    if success:
-        return {"message": "Test email sent successfully"}
-    else:
-        return {"message": "Failed to send test email. Check configuration."}
+    if not email_service.is_configured:
+        return EMAIL_NOT_CONFIGURED
+
+    background_tasks.add_task(email_service.send_test_email)
+    return {"message": "Test email is being sent", "status": "queued"}
 
 
-@app.post("/send-weekly-reminder")
-async def trigger_weekly_reminder(
+@authenticated_router.post("/send-weekly-reminder")
+def trigger_weekly_reminder(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Manually trigger the weekly reminder email.
 
     Useful for testing without waiting for the scheduled time.
+    The email is sent in the background after the response is returned.
 
     Args:
+        background_tasks (BackgroundTasks): Tasks to run after the response (injected).
         db (Session): Database session (injected).
 
     Returns:
-        dict: Success or error message.
+        dict: Status message.
     """
+    if not email_service.is_configured:
+        return EMAIL_NOT_CONFIGURED
+
     drugs = crud.get_drugs(db)
-    success = await email_service.send_weekly_reminder(drugs)
-    if success:
-        return {"message": "Weekly reminder sent successfully"}
-    else:
-        return {"message": "Failed to send reminder"}
+    background_tasks.add_task(email_service.send_weekly_reminder, drugs)
+    return {"message": "Weekly reminder is being sent", "status": "queued"}
 
 
-@app.post("/send-reorder-reminder")
-async def trigger_reorder_reminder(
+@authenticated_router.post("/send-reorder-reminder")
+def trigger_reorder_reminder(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Manually trigger the reorder reminder email.
 
     Useful for testing without waiting for the scheduled time.
+    The email is sent in the background after the response is returned.
 
     Args:
+        background_tasks (BackgroundTasks): Tasks to run after the response (injected).
         db (Session): Database session (injected).
 
     Returns:
-        dict: Success or error message.
+        dict: Status message.
     """
+    # One query; the reorder subset is filtered from the drugs already loaded
     all_drugs = crud.get_drugs(db)
-    drugs_to_reorder = crud.get_drugs_needing_reorder(db)
+    drugs_to_reorder = [drug for drug in all_drugs if drug.needs_reorder]
     doctor_vacation = crud.get_current_doctor_vacation(db)
     if not drugs_to_reorder:
         return {"message": "No drugs need reordering at this time"}
 
-    success = await email_service.send_reorder_reminder(drugs_to_reorder, all_drugs, doctor_vacation)
-    if success:
-        return {"message": f"Reorder reminder sent for {len(drugs_to_reorder)} drug(s)"}
-    else:
-        return {"message": "Failed to send reminder"}
+    if not email_service.is_configured:
+        return EMAIL_NOT_CONFIGURED
+
+    background_tasks.add_task(email_service.send_reorder_reminder, drugs_to_reorder, all_drugs, doctor_vacation)
+    return {"message": f"Reorder reminder for {len(drugs_to_reorder)} drug(s) is being sent", "status": "queued"}
 
 
 # ============================================================================
@@ -393,11 +593,10 @@ async def trigger_reorder_reminder(
 # ============================================================================
 
 
-@app.post("/doctor-vacations/", response_model=schemas.DoctorVacationResponse)
+@authenticated_router.post("/doctor-vacations/", response_model=schemas.DoctorVacationResponse)
 def create_doctor_vacation(
     vacation: schemas.DoctorVacationCreate,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Create a new doctor vacation period.
@@ -412,31 +611,51 @@ def create_doctor_vacation(
     return crud.create_doctor_vacation(db, vacation)
 
 
-@app.get("/doctor-vacations/", response_model=List[schemas.DoctorVacationResponse])
+@authenticated_router.get("/doctor-vacations/", response_model=schemas.CursorPage[schemas.DoctorVacationResponse])
 def get_doctor_vacations(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    per_page: int = Query(100, ge=1, le=100),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True),
+    limit: Optional[int] = Query(None, ge=1, deprecated=True),
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
-    Get all doctor vacation periods.
+    Get all doctor vacation periods, one page at a time.
 
     Args:
-        skip (int): Number of records to skip.
-        limit (int): Maximum number of records to return.
+        cursor (str, optional): next_cursor from the previous page.
+        per_page (int): Max number of vacation periods per page.
+        skip (int, optional): Deprecated offset pagination, use cursor instead.
+        limit (int, optional): Deprecated alias for per_page.
         db (Session): Database session (injected).
 
     Returns:
-        List[DoctorVacationResponse]: List of vacation periods.
-    """
-    return crud.get_doctor_vacations(db, skip=skip, limit=limit)
+        CursorPage[DoctorVacationResponse]: Vacation periods ordered by start date
+        plus the cursor for the next page.
+    """
+    page_size = limit or per_page
+    if skip is not None:
+        vacations = crud.get_doctor_vacations(db, skip=skip, limit=page_size)
+    elif cursor:
+        try:
+            last_start_date, last_id = _decode_cursor(cursor)
+            last_start_date, last_id = date.fromisoformat(last_start_date), int(last_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        vacations = crud.get_doctor_vacations_after(db, last_start_date, last_id, limit=page_size)
+    else:
+        vacations = crud.get_doctor_vacations_after(db, limit=page_size)
+
+    next_cursor = None
+    if len(vacations) == page_size:
+        last = vacations[-1]
+        next_cursor = _encode_cursor(last.start_date.isoformat(), last.id)
+    return {"items": vacations, "next_cursor": next_cursor}
 
 
-@app.get("/doctor-vacations/current", response_model=schemas.DoctorVacationResponse | None)
+@authenticated_router.get("/doctor-vacations/current", response_model=schemas.DoctorVacationResponse | None)
 def get_current_doctor_vacation(
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Get the current doctor vacation (if doctor is on vacation today).
@@ -450,11 +669,10 @@ def get_current_doctor_vacation(
     return crud.get_current_doctor_vacation(db)
 
 
-@app.get("/doctor-vacations/{vacation_id}", response_model=schemas.DoctorVacationResponse)
+@authenticated_router.get("/doctor-vacations/{vacation_id}", response_model=schemas.DoctorVacationResponse)
 def get_doctor_vacation(
     vacation_id: int,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Get a specific doctor vacation period.
@@ -475,12 +693,11 @@ def get_doctor_vacation(
     return db_vacation
 
 
-@app.put("/doctor-vacations/{vacation_id}", response_model=schemas.DoctorVacationResponse)
+@authenticated_router.put("/doctor-vacations/{vacation_id}", response_model=schemas.DoctorVacationResponse)
 def update_doctor_vacation(
     vacation_id: int,
     vacation: schemas.DoctorVacationUpdate,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Update a doctor vacation period.
@@ -502,11 +719,10 @@ def update_doctor_vacation(
     return db_vacation
 
 
-@app.delete("/doctor-vacations/{vacation_id}")
+@authenticated_router.delete("/doctor-vacations/{vacation_id}")
 def delete_doctor_vacation(
     vacation_id: int,
     db: Session = Depends(get_db),
-    current_user: str = Depends(get_current_user),
 ):
     """
     Delete a doctor vacation period.
@@ -525,3 +741,6 @@ def delete_doctor_vacation(
     if not success:
         raise HTTPException(status_code=404, detail="Doctor vacation not found")
     return {"message": "Doctor vacation deleted successfully"}
+
+
+app.include_router(authenticated_router)
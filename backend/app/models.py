@@ -5,10 +5,46 @@ This module defines the SQLAlchemy ORM models for storing drug information
 and doctor vacation periods.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Date
+from sqlalchemy import Column, Computed, Integer, String, Float, DateTime, Boolean, Date, Index
+from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime, date
+from functools import lru_cache
 from .database import Base
 
+# A drug needs to be reordered when fewer than this many weeks of pills remain
+REORDER_THRESHOLD_WEEKS = 3
+
+# Pills consumed per day. Daily schedules sum all doses; weekly alternating
+# schedules average (even_week + odd_week) over the 14 day cycle, or 0 if
+# either week is missing.
+DAILY_CONSUMPTION_SQL = (
+    "CASE WHEN schedule_type = 'weekly_alternating' "
+    "THEN COALESCE((even_week_pills + odd_week_pills) / 14.0, 0) "
+    "ELSE morning_pre_food + morning_post_food + evening_pre_food + evening_post_food END"
+)
+
+# Weeks until pills run out, or 0 if the drug is not taken at all
+WEEKS_REMAINING_SQL = (
+    "CASE WHEN daily_consumption = 0 THEN 0 "
+    "ELSE current_amount / daily_consumption / 7 END"
+)
+
+
+@lru_cache(maxsize=1)
+def week_type_for(day: date) -> str:
+    """
+    Determine if the ISO week containing a day is even or odd.
+
+    Args:
+        day (date): Any day of the week.
+
+    Returns:
+        str: "even" or "odd" based on ISO week number.
+
+    Cached so the week number is computed once per day, not once per drug.
+    """
+    return "even" if day.isocalendar()[1] % 2 == 0 else "odd"
+
 
 class Drug(Base):
     """
@@ -27,6 +63,10 @@ class Drug(Base):
         even_week_pills (float): Total pills per week in even weeks (for weekly_alternating).
         odd_week_pills (float): Total pills per week in odd weeks (for weekly_alternating).
         current_amount (float): Current number of pills remaining (supports half pills).
+        daily_consumption (float): Average pills consumed per day. Generated by the database
+            from the schedule columns (see DAILY_CONSUMPTION_SQL).
+        weeks_remaining (float): Weeks until pills run out. Generated by the database
+            (see WEEKS_REMAINING_SQL) and indexed for the reorder check.
         notes (str): Optional notes (e.g., specific instructions).
         last_refilled_at (datetime): When this drug was last refilled (None if never refilled).
         created_at (datetime): When this drug was added to the system.
@@ -43,6 +83,13 @@ class Drug(Base):
     """
 
     __tablename__ = "drugs"
+    __table_args__ = (
+        # Serves the needs_reorder filter (weeks_remaining < REORDER_THRESHOLD_WEEKS)
+        Index("ix_drugs_reorder", "weeks_remaining"),
+    )
+    # Read the generated columns back (RETURNING) on every insert and update,
+    # so they are current without an extra refresh query.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -56,32 +103,13 @@ class Drug(Base):
     even_week_pills = Column(Float, nullable=True)  # for weekly_alternating schedule
     odd_week_pills = Column(Float, nullable=True)  # for weekly_alternating schedule
     current_amount = Column(Float, nullable=False, default=0)
+    daily_consumption = Column(Float, Computed(DAILY_CONSUMPTION_SQL, persisted=False))
+    weeks_remaining = Column(Float, Computed(WEEKS_REMAINING_SQL, persisted=False))
     notes = Column(String, nullable=True)
     last_refilled_at = Column(DateTime, nullable=True)  # Tracks when drug was last refilled
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    @property
-    def daily_consumption(self) -> float:
-        """
-        Calculate how many pills are consumed per day.
-
-        Returns:
-            float: Average pills consumed daily.
-
-        For daily schedules: sum of all doses per day.
-        For weekly alternating: average of (even_week + odd_week) / 14 days.
-        """
-        if self.schedule_type == "weekly_alternating":
-            # Average consumption over a 2-week cycle
-            if self.even_week_pills is not None and self.odd_week_pills is not None:
-                return (self.even_week_pills + self.odd_week_pills) / 14.0
-            return 0
-        else:
-            # Daily schedule: sum of all doses
-            return (self.morning_pre_food + self.morning_post_food +
-                    self.evening_pre_food + self.evening_post_food)
-
     @property
     def days_remaining(self) -> float:
         """
@@ -94,25 +122,17 @@ class Drug(Base):
             return 0
         return self.current_amount / self.daily_consumption
 
-    @property
-    def weeks_remaining(self) -> float:
-        """
-        Calculate how many weeks worth of pills remain.
-
-        Returns:
-            float: Number of weeks until pills run out.
-        """
-        return self.days_remaining / 7
-
-    @property
+    @hybrid_property
     def needs_reorder(self) -> bool:
         """
         Check if drug needs to be reordered (less than 3 weeks remaining).
 
         Returns:
             bool: True if less than 3 weeks of pills remain, False otherwise.
+
+        Works on the class too, so Drug.needs_reorder can be used as a SQL filter.
         """
-        return self.weeks_remaining < 3
+        return self.weeks_remaining < REORDER_THRESHOLD_WEEKS
 
     @property
     def current_week_type(self) -> str:
@@ -122,9 +142,7 @@ class Drug(Base):
         Returns:
             str: "even" or "odd" based on ISO week number.
         """
-        from datetime import datetime
-        week_number = datetime.now().isocalendar()[1]
-        return "even" if week_number % 2 == 0 else "odd"
+        return week_type_for(date.today())
 
     @property
     def current_week_pills(self) -> float:
@@ -134,8 +152,20 @@ class Drug(Base):
         Returns:
             float: Pills for this week, or 0 if not applicable.
         """
+        return self.pills_for_week(self.current_week_type)
+
+    def pills_for_week(self, week_type: str) -> float:
+        """
+        Get pills for an even or odd week (for weekly_alternating schedule).
+
+        Args:
+            week_type (str): "even" or "odd".
+
+        Returns:
+            float: Pills for that week, or 0 if not applicable.
+        """
         if self.schedule_type == "weekly_alternating":
-            if self.current_week_type == "even":
+            if week_type == "even":
                 return self.even_week_pills or 0
             else:
                 return self.odd_week_pills or 0
@@ -163,6 +193,10 @@ class DoctorVacation(Base):
     """
 
     __tablename__ = "doctor_vacations"
+    __table_args__ = (
+        # Serves the "is the doctor away today" lookup (start_date <= today <= end_date)
+        Index("ix_doctor_vacations_range", "start_date", "end_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     start_date = Column(Date, nullable=False)
@@ -7,7 +7,9 @@ They provide automatic validation and documentation for the FastAPI endpoints.
 
 from pydantic import BaseModel, Field
 from datetime import datetime, date
-from typing import Optional
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 class DrugBase(BaseModel):
@@ -150,3 +152,14 @@ class DoctorVacationResponse(DoctorVacationBase):
         """Pydantic configuration."""
 
         from_attributes = True  # Allows creating from ORM models
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Schema for one page of a list response.
+
+    Pass next_cursor back as the cursor query parameter to get the next page.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
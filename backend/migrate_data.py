@@ -8,6 +8,19 @@ handling schema differences.
 import sqlite3
 from datetime import datetime
 
+# Columns written to the new drugs table, in insert order
+INSERT_COLUMNS = (
+    'name', 'dosage_strength', 'package_size', 'schedule_type',
+    'morning_pre_food', 'morning_post_food', 'evening_pre_food', 'evening_post_food',
+    'even_week_pills', 'odd_week_pills', 'current_amount', 'notes',
+    'last_refilled_at', 'created_at', 'updated_at',
+)
+INSERT_SQL = (
+    f"INSERT INTO drugs ({', '.join(INSERT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(INSERT_COLUMNS))})"
+)
+
+
 def migrate_data():
     """Transfer data from medicinebu.db to medicine.db"""
 
@@ -41,59 +54,54 @@ def migrate_data():
         # Create a mapping of column name to index
         col_map = {name: idx for idx, name in enumerate(old_col_names)}
 
-        # Migrate each drug
-        migrated = 0
-        for row in old_data:
-            # Extract data with defaults for missing fields
-            drug_data = {
-                'name': row[col_map['name']],
-                'dosage_strength': row[col_map.get('dosage_strength')] if 'dosage_strength' in col_map else None,
-                'package_size': row[col_map['package_size']],
-                'schedule_type': row[col_map.get('schedule_type')] if 'schedule_type' in col_map else 'daily',
-                'morning_pre_food': row[col_map.get('morning_pre_food', col_map.get('pills_per_dose', 0))],
-                'morning_post_food': row[col_map.get('morning_post_food', 0)],
-                'evening_pre_food': row[col_map.get('evening_pre_food', 0)],
-                'evening_post_food': row[col_map.get('evening_post_food', 0)],
-                'even_week_pills': row[col_map.get('even_week_pills')] if 'even_week_pills' in col_map else None,
-                'odd_week_pills': row[col_map.get('odd_week_pills')] if 'odd_week_pills' in col_map else None,
-                'current_amount': row[col_map['current_amount']],
-                'notes': row[col_map.get('notes')] if 'notes' in col_map else None,
-                'last_refilled_at': None,  # New field, set to None for old data
-                'created_at': row[col_map.get('created_at')] if 'created_at' in col_map else datetime.utcnow().isoformat(),
-                'updated_at': row[col_map.get('updated_at')] if 'updated_at' in col_map else datetime.utcnow().isoformat(),
-            }
-
-            # Insert into new database
-            new_cursor.execute("""
-                INSERT INTO drugs (
-                    name, dosage_strength, package_size, schedule_type,
-                    morning_pre_food, morning_post_food, evening_pre_food, evening_post_food,
-                    even_week_pills, odd_week_pills, current_amount, notes,
-                    last_refilled_at, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                drug_data['name'],
-                drug_data['dosage_strength'],
-                drug_data['package_size'],
-                drug_data['schedule_type'],
-                drug_data['morning_pre_food'],
-                drug_data['morning_post_food'],
-                drug_data['evening_pre_food'],
-                drug_data['evening_post_food'],
-                drug_data['even_week_pills'],
-                drug_data['odd_week_pills'],
-                drug_data['current_amount'],
-                drug_data['notes'],
-                drug_data['last_refilled_at'],
-                drug_data['created_at'],
-                drug_data['updated_at']
-            ))
-
-            migrated += 1
-            print(f"[OK] Migrated: {drug_data['name']}")
-
-        # Commit changes
+        # Resolve each column's position once; -1 means the old database lacks it
+        name_idx = col_map['name']
+        dosage_idx = col_map.get('dosage_strength', -1)
+        package_size_idx = col_map['package_size']
+        schedule_idx = col_map.get('schedule_type', -1)
+        morning_pre_idx = col_map.get('morning_pre_food', col_map.get('pills_per_dose', -1))
+        morning_post_idx = col_map.get('morning_post_food', -1)
+        evening_pre_idx = col_map.get('evening_pre_food', -1)
+        evening_post_idx = col_map.get('evening_post_food', -1)
+        even_week_idx = col_map.get('even_week_pills', -1)
+        odd_week_idx = col_map.get('odd_week_pills', -1)
+        amount_idx = col_map['current_amount']
+        notes_idx = col_map.get('notes', -1)
+        created_idx = col_map.get('created_at', -1)
+        updated_idx = col_map.get('updated_at', -1)
+        now = datetime.utcnow().isoformat()
+
+        # Build all rows first (in INSERT_COLUMNS order), then insert them in a single batch
+        rows = [
+            (
+                row[name_idx],
+                row[dosage_idx] if dosage_idx >= 0 else None,
+                row[package_size_idx],
+                row[schedule_idx] if schedule_idx >= 0 else 'daily',
+                row[morning_pre_idx] if morning_pre_idx >= 0 else 0,
+                row[morning_post_idx] if morning_post_idx >= 0 else 0,
+                row[evening_pre_idx] if evening_pre_idx >= 0 else 0,
+                row[evening_post_idx] if evening_post_idx >= 0 else 0,
+                row[even_week_idx] if even_week_idx >= 0 else None,
+                row[odd_week_idx] if odd_week_idx >= 0 else None,
+                row[amount_idx],
+                row[notes_idx] if notes_idx >= 0 else None,
+                None,  # last_refilled_at: new field, set to None for old data
+                row[created_idx] if created_idx >= 0 else now,
+                row[updated_idx] if updated_idx >= 0 else now,
+            )
+            for row in old_data
+        ]
+
+        # Insert everything in one transaction; skip fsync and keep the journal
+        # in memory while bulk loading
+        new_db.isolation_level = None
+        new_cursor.execute("PRAGMA synchronous=OFF")
+        new_cursor.execute("PRAGMA journal_mode=MEMORY")
+        new_cursor.execute("BEGIN")
+        new_cursor.executemany(INSERT_SQL, rows)
         new_db.commit()
+        migrated = len(rows)
 
         print(f"\n[SUCCESS] Successfully migrated {migrated} drugs!")
 
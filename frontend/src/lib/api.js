@@ -41,6 +41,23 @@ api.interceptors.response.use(
   }
 );
 
+/**
+ * Fetch every page of a cursor-paginated list endpoint.
+ *
+ * @param {string} url - The list endpoint.
+ * @returns {Promise<Array>} All items from all pages.
+ */
+async function getAllPages(url) {
+  const items = [];
+  let cursor = null;
+  do {
+    const response = await api.get(url, { params: cursor ? { cursor } : {} });
+    items.push(...response.data.items);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return items;
+}
+
 /**
  * Drug API functions
  */
@@ -51,8 +68,7 @@ export const drugApi = {
    * @returns {Promise<Array>} Array of drug objects.
    */
   async getAll() {
-    const response = await api.get('/drugs/');
-    return response.data;
+    return getAllPages('/drugs/');
   },
 
   /**
@@ -167,8 +183,7 @@ export const vacationApi = {
    * @returns {Promise<Array>} Array of vacation periods.
    */
   async getAll() {
-    const response = await api.get('/doctor-vacations/');
-    return response.data;
+    return getAllPages('/doctor-vacations/');
   },
 
   /**